@@ -86,6 +86,43 @@ def test_widget_factory():
         traceback.print_exc()
         return False
 
+def test_coerce_value():
+    """Test WidgetFactory.coerce_value on restored settings"""
+    print("\\n🧪 Testing coerce_value...")
+    
+    try:
+        from types import SimpleNamespace
+        from modules.widget_factory import WidgetFactory
+        factory = WidgetFactory()
+
+        def coerce(current, stored):
+            return factory.coerce_value(SimpleNamespace(value=current), stored)
+        
+        # Accepted: JSON lists for tuple widgets, int -> float widening, exact types
+        assert coerce(('a',), ['b', 'c']) == ('b', 'c')
+        assert coerce(1.5, 2) == 2.0 and isinstance(coerce(1.5, 2), float)
+        assert coerce('none', 'model') == 'model'
+        assert coerce(False, True) is True
+        print("✅ Matching values coerced correctly")
+        
+        # Rejected: anything that would need a lossy or invented conversion
+        for current, stored in [('text', ['b']), (4, 4.7), (False, 'yes'), (False, 1), (3, True)]:
+            try:
+                coerce(current, stored)
+            except ValueError:
+                continue
+            print(f"❌ {stored!r} was accepted for a {type(current).__name__} widget")
+            return False
+        print("✅ Mismatched values rejected")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ coerce_value test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_verbose_manager():
     """Test VerboseOutputManager functionality"""
     print("\\n🧪 Testing VerboseOutputManager...")
@@ -142,6 +179,31 @@ def test_json_utils():
         loaded_data = js.load_settings("TEST_SECTION")
         print(f"✅ Settings loaded: {loaded_data}")
         
+        # Cached document access on a scratch file
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'settings.json')
+            js.write(path, {'WIDGETS': {'a': 1}, 'WEBUI': {'current': 'A1111'}})
+            assert js.read_cached(path)['WIDGETS'] == {'a': 1}
+            
+            # An external write is picked up through the changed mtime
+            js.write(path, {'WIDGETS': {'a': 2}, 'WEBUI': {'current': 'A1111'}})
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert js.read_cached(path)['WIDGETS'] == {'a': 2}
+            print("✅ read_cached re-reads after an external write")
+            
+            # Replacing one section leaves the others intact
+            assert js.save_section(path, 'WIDGETS', {'a': 3})
+            assert js.read(path) == {'WIDGETS': {'a': 3}, 'WEBUI': {'current': 'A1111'}}
+            print("✅ save_section keeps the other sections")
+            
+            # An unchanged section is not written again
+            os.utime(path, ns=(0, 1_000_000_000))
+            assert js.save_section(path, 'WIDGETS', {'a': 3})
+            assert os.stat(path).st_mtime_ns == 1_000_000_000
+            print("✅ save_section skips unchanged sections")
+        
         return True
         
     except Exception as e:
@@ -150,6 +212,56 @@ def test_json_utils():
         traceback.print_exc()
         return False
 
+def test_model_data_utils():
+    """Test model_data_utils parsing and caching"""
+    print("\\n🧪 Testing model_data_utils...")
+    
+    try:
+        import tempfile
+        from modules import model_data_utils as mdu
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, '_models_data.py')
+
+            def write_data(source, mtime_ns):
+                with open(path, 'w') as f:
+                    f.write(source)
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+            
+            # Plain literal dicts are read without executing the file
+            write_data("model_list = {'A': {'url': 'a'}, 'B': {'url': 'b'}}\n", 1_000_000_000)
+            assert mdu.read(path) == {'model_list': {'A': {'url': 'a'}, 'B': {'url': 'b'}}}
+            assert mdu.read_names(path, 'model_list') == ('A', 'B')
+            print("✅ Literal dict file parsed")
+            
+            # Non-literal assignments are skipped, the rest of the file still loads
+            write_data("vae_list = {'V': {}}\ncount = len(vae_list)\nlora_list = ['not', 'a', 'dict']\n", 2_000_000_000)
+            data = mdu.read(path)
+            assert 'count' not in data and data['vae_list'] == {'V': {}}
+            print("✅ Non-literal assignment skipped")
+            
+            # A list that isn't a dict is rejected by read_names
+            try:
+                mdu.read_names(path, 'lora_list')
+            except TypeError:
+                print("✅ Non-dict list rejected")
+            else:
+                print("❌ read_names accepted a non-dict list")
+                return False
+            
+            # A new mtime invalidates the cached parse
+            write_data("model_list = {'C': {}}\n", 3_000_000_000)
+            assert mdu.read_names(path, 'model_list') == ('C',)
+            print("✅ Cache refreshed after the file changed")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ model_data_utils test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_webui_utils():
     """Test webui_utils functionality"""
     print("\\n🧪 Testing webui_utils...")
@@ -260,8 +372,10 @@ def main():
         ("File Dependencies", test_file_dependencies),
         ("Basic Imports", test_imports),
         ("WidgetFactory", test_widget_factory),
+        ("coerce_value", test_coerce_value),
         ("VerboseOutputManager", test_verbose_manager),
         ("json_utils", test_json_utils),
+        ("model_data_utils", test_model_data_utils),
         ("webui_utils", test_webui_utils),
         ("WidgetManager", test_widget_manager)
     ]
@@ -6,6 +6,7 @@
 
 import json
 from IPython.display import HTML, Javascript
+import model_data_utils as mdu
 
 class EnhancedModelSelector:
     def __init__(self, widget_manager, model_data_path):
@@ -17,11 +18,8 @@ class EnhancedModelSelector:
         
     def load_model_data(self, data_path):
         """Load and parse model data from the data file"""
-        local_vars = {}
         try:
-            with open(data_path) as f:
-                exec(f.read(), {}, local_vars)
-            return local_vars.get('model_list', {})
+            return mdu.read(data_path).get('model_list', {})
         except Exception as e:
             print(f"Warning: Could not load model data: {e}")
             return {}
@@ -5,6 +5,9 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Union
 import os
 
+# Parsed documents for read_cached: {path: (st_mtime_ns, data)}
+_DOCUMENT_CACHE = {}
+
 # --- Internal Helper Functions ---
 
 def _get_nested(data: Dict, key: str, default: Any = None) -> Any:
@@ -89,6 +92,41 @@ def update(file_path: Union[str, Path], key: str, update_dict: Dict):
     _set_nested(data, key, update_dict)
     return write(file_path, data)
 
+def read_cached(file_path: Union[str, Path]) -> Dict:
+    """
+    Reads an entire JSON file, re-parsing it only when its modification time changes.
+    The returned dict is shared between callers; copy it before modifying.
+    """
+    path = str(file_path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    cached = _DOCUMENT_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read(path) or {})
+        _DOCUMENT_CACHE[path] = cached
+    return cached[1]
+
+def save_section(file_path: Union[str, Path], section: str, data: Any) -> bool:
+    """
+    Replaces one top-level section of a JSON file, starting from the cached document.
+    Skips the write when the section is unchanged; returns False only if writing failed.
+    """
+    path = str(file_path)
+    document = dict(read_cached(path))
+    if document.get(section) == data:
+        return True
+    
+    document[section] = data
+    if not write(path, document):
+        return False
+    
+    # What was just written is the new cached document; no need to parse it back
+    _DOCUMENT_CACHE[path] = (os.stat(path).st_mtime_ns, document)
+    return True
+
 def key_exists(file_path: Union[str, Path], key: str) -> bool:
     """
     Checks if a dot-separated key exists within the JSON file.
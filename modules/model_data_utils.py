@@ -0,0 +1,57 @@
+# ~ model_data_utils.py | Cached, exec-free reading of the _models_data.py files ~
+
+import ast
+import functools
+import os
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+# --- Internal Helper Functions ---
+
+@functools.lru_cache(maxsize=8)
+def _parse(path: str, mtime: int) -> Dict:
+    """
+    Parses a models data file into {name: value} for its top-level literal assignments.
+    Cached per (path, st_mtime_ns), so an edited file is picked up on the next read.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    
+    data = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError):
+            continue  # Computed assignments are not data; skip them instead of failing the file
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                data[target.id] = value
+    return data
+
+@functools.lru_cache(maxsize=32)
+def _names(path: str, mtime: int, list_name: str) -> Tuple[str, ...]:
+    """Returns the entry names of one dict in a parsed models data file."""
+    value = _parse(path, mtime).get(list_name, {})
+    if not isinstance(value, dict):
+        raise TypeError(f"Data for '{list_name}' is not a dictionary.")
+    return tuple(value)
+
+# --- Main Public Functions ---
+
+def read(file_path: Union[str, Path]) -> Dict:
+    """
+    Returns the top-level literal assignments of a models data file, e.g. read(path)['model_list'].
+    The file is never executed. The returned dict is shared between callers and must not be mutated.
+    """
+    path = str(file_path)
+    return _parse(path, os.stat(path).st_mtime_ns)
+
+def read_names(file_path: Union[str, Path], list_name: str) -> Tuple[str, ...]:
+    """
+    Returns the names (keys) of one list in a models data file, e.g. read_names(path, 'vae_list').
+    Raises TypeError if that entry is not a dictionary.
+    """
+    path = str(file_path)
+    return _names(path, os.stat(path).st_mtime_ns, list_name)
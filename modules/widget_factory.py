@@ -8,9 +8,26 @@ FIXED: Ensures all widgets properly support callbacks and event handling
 
 import ipywidgets as widgets
 from IPython.display import display, HTML, Javascript
+from contextlib import ExitStack
 from pathlib import Path
+import functools
 import json
 import os
+import threading
+
+@functools.lru_cache(maxsize=32)
+def _read_asset_cached(path, mtime):
+    """Read a CSS/JS asset file; cached per (path, mtime)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _read_asset(path):
+    """Return the contents of an asset file, or None if it doesn't exist."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _read_asset_cached(path, mtime)
 
 class WidgetFactory:
     """
@@ -22,6 +39,7 @@ class WidgetFactory:
         self.default_style = {'description_width': 'initial'}
         self.loaded_css = set()
         self.loaded_js = set()
+        self._pending_timers = {}
         
     # === UTILITY METHODS ===
     
@@ -61,13 +79,11 @@ class WidgetFactory:
                 css_content = str(css_path_or_content)
             else:
                 # Treat as file path
-                css_path = Path(css_path_or_content)
-                if css_path.exists() and str(css_path) not in self.loaded_css:
-                    with open(css_path, 'r', encoding='utf-8') as f:
-                        css_content = f.read()
-                    self.loaded_css.add(str(css_path))
-                else:
+                css_path = str(Path(css_path_or_content))
+                css_content = None if css_path in self.loaded_css else _read_asset(css_path)
+                if css_content is None:
                     return  # Already loaded or doesn't exist
+                self.loaded_css.add(css_path)
             
             display(HTML(f'<style>{css_content}</style>'))
             
@@ -82,19 +98,50 @@ class WidgetFactory:
                 js_content = str(js_path_or_content)
             else:
                 # Treat as file path
-                js_path = Path(js_path_or_content)
-                if js_path.exists() and str(js_path) not in self.loaded_js:
-                    with open(js_path, 'r', encoding='utf-8') as f:
-                        js_content = f.read()
-                    self.loaded_js.add(str(js_path))
-                else:
+                js_path = str(Path(js_path_or_content))
+                js_content = None if js_path in self.loaded_js else _read_asset(js_path)
+                if js_content is None:
                     return  # Already loaded or doesn't exist
+                self.loaded_js.add(js_path)
             
             display(Javascript(js_content))
             
         except Exception as e:
             print(f"Warning: Could not load JS: {e}")
     
+    def preload_assets(self, *paths):
+        """Warm the asset cache on a background thread; join it before load_assets for a guaranteed hit."""
+        def warm():
+            for path in paths:
+                _read_asset(str(Path(path)))
+        
+        thread = threading.Thread(target=warm, daemon=True)
+        thread.start()
+        return thread
+    
+    def load_assets(self, css_path, js_path=None):
+        """Load a CSS file and an optional JS file with a single display call."""
+        try:
+            parts = []
+            css_path = str(Path(css_path))
+            css_content = None if css_path in self.loaded_css else _read_asset(css_path)
+            if css_content is not None:
+                parts.append(f'<style>{css_content}</style>')
+                self.loaded_css.add(css_path)
+            
+            if js_path is not None:
+                js_path = str(Path(js_path))
+                js_content = None if js_path in self.loaded_js else _read_asset(js_path)
+                if js_content is not None:
+                    parts.append(f'<script>{js_content}</script>')
+                    self.loaded_js.add(js_path)
+            
+            if parts:
+                display(HTML(''.join(parts)))
+        
+        except Exception as e:
+            print(f"Warning: Could not load assets: {e}")
+    
     # === CORE WIDGET CREATION ===
     
     def _create_widget(self, widget_type, class_names=None, **kwargs):
@@ -370,6 +417,10 @@ class WidgetFactory:
         
         return tab
     
+    def create_many(self, specs):
+        """Create widgets from (key, kind, *args) specs, e.g. ('Model_url', 'text', '', 'Model URL:')."""
+        return {key: getattr(self, f'create_{kind}')(*args) for key, kind, *args in specs}
+    
     # === OUTPUT AND DISPLAY WIDGETS ===
     
     def create_html(self, value='', class_names=None, **kwargs):
@@ -455,6 +506,46 @@ class WidgetFactory:
             widget.unobserve(handler, names=names, type=type)
         return widget
     
+    def hold_sync(self, *widgets_to_hold):
+        """Hold frontend syncs for several widgets and flush them together on exit."""
+        stack = ExitStack()
+        for widget in widgets_to_hold:
+            if hasattr(widget, 'hold_sync'):
+                stack.enter_context(widget.hold_sync())
+        return stack
+    
+    def coerce_value(self, widget, value):
+        """Adapt a stored (JSON-decoded) value to the widget's current type; raise ValueError on a mismatch."""
+        current = widget.value
+        # JSON turns tuples into lists and may write whole floats as ints; nothing else is converted
+        if isinstance(current, tuple) and isinstance(value, list):
+            return tuple(value)
+        if type(current) is float and type(value) is int:
+            return float(value)
+        if current is None or type(value) is type(current):
+            return value
+        raise ValueError(f"expected {type(current).__name__}, got {type(value).__name__} {value!r}")
+    
+    def batch_update(self, *widgets_to_hold):
+        """Like hold_sync, but also defer trait notifications until the batch is applied."""
+        stack = self.hold_sync(*widgets_to_hold)
+        for widget in widgets_to_hold:
+            if hasattr(widget, 'hold_trait_notifications'):
+                stack.enter_context(widget.hold_trait_notifications())
+        return stack
+    
+    def debounce(self, key, delay, callback, *args):
+        """Run callback(*args) after delay seconds, replacing any call still pending under key."""
+        pending = self._pending_timers.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+        
+        timer = threading.Timer(delay, callback, args)
+        timer.daemon = True
+        self._pending_timers[key] = timer
+        timer.start()
+        return timer
+    
     def close(self, widget, class_names=None, delay=0):
         """Close/hide a widget with optional animation."""
         if class_names:
@@ -462,9 +553,12 @@ class WidgetFactory:
         
         if hasattr(widget, 'close'):
             if delay > 0:
-                import time
-                time.sleep(delay)
-            widget.close()
+                # Let the hide animation play without blocking the kernel
+                timer = threading.Timer(delay, widget.close)
+                timer.daemon = True
+                timer.start()
+            else:
+                widget.close()
         
         return widget
     
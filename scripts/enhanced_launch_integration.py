@@ -51,19 +51,17 @@ def find_script_path():
         return Path(__file__).parent.resolve()
     except NameError: 
         pass
+    # One os.path stat per candidate; a present data file implies its directory exists
     env_path = os.environ.get('scr_path')
-    if env_path:
-        scripts_dir = Path(env_path) / 'scripts'
-        if scripts_dir.exists() and (scripts_dir / '_models_data.py').exists(): 
-            return scripts_dir
-    cwd = Path.cwd()
-    if (cwd / 'scripts' / '_models_data.py').exists(): 
-        return cwd / 'scripts'
-    if cwd.name == 'scripts' and (cwd / '_models_data.py').exists(): 
-        return cwd
-    hardcoded_path = Path('/content/LSDAI/scripts')
-    if hardcoded_path.exists(): 
-        return hardcoded_path
+    if env_path and os.path.isfile(os.path.join(env_path, 'scripts', '_models_data.py')):
+        return Path(env_path) / 'scripts'
+    cwd = os.getcwd()
+    if os.path.isfile(os.path.join(cwd, 'scripts', '_models_data.py')):
+        return Path(cwd) / 'scripts'
+    if os.path.basename(cwd) == 'scripts' and os.path.isfile(os.path.join(cwd, '_models_data.py')):
+        return Path(cwd)
+    if os.path.isdir('/content/LSDAI/scripts'):
+        return Path('/content/LSDAI/scripts')
     raise FileNotFoundError("Could not determine the script path. Please ensure you are running from the LSDAI directory.")
 
 try:
@@ -4,84 +4,67 @@
 from modules.widget_factory import WidgetFactory
 from modules.webui_utils import update_current_webui
 from modules import json_utils as js
+from modules import model_data_utils as mdu
 from modules.verbose_output_manager import get_verbose_manager, VerbosityLevel
 from IPython.display import display, Javascript, HTML
 import ipywidgets as widgets
 from pathlib import Path
+from types import MappingProxyType
+import functools
 import json
 import os
 import sys
+import threading
 import time
 
 # --- ROBUST PATH RESOLUTION ---
-def find_script_path():
-    """Find the absolute path to the 'scripts' directory using multiple methods."""
-    errors = []
-    
-    # Method 1: Use __file__ if available
+def _found_script_path(path, method):
+    """Report how the scripts directory was found and return it as a Path."""
+    script_path = Path(path)
+    print(f"✅ Found script path via {method}: {script_path}")
+    return script_path
+
+def _script_path_candidates():
+    """Yield (method, directory) pairs to probe for the scripts directory, in precedence order."""
+    # The script's own location is authoritative whenever it is known
     try:
-        script_path = Path(__file__).parent.resolve()
-        if (script_path / '_models_data.py').exists():
-            print(f"✅ Found script path via __file__: {script_path}")
-            return script_path
+        yield "__file__", os.path.dirname(os.path.realpath(__file__))
     except NameError:
-        errors.append("__file__ not defined")
-    except Exception as e:
-        errors.append(f"__file__ method failed: {e}")
+        pass
     
-    # Method 2: Use environment variable
     env_path = os.environ.get('scr_path')
-    if env_path:
-        scripts_dir = Path(env_path) / 'scripts'
-        if scripts_dir.exists():
-            if (scripts_dir / '_models_data.py').exists():
-                print(f"✅ Found script path via environment: {scripts_dir}")
-                return scripts_dir
-            else:
-                errors.append(f"Environment path exists but no _models_data.py: {scripts_dir}")
-        else:
-            errors.append(f"Environment path does not exist: {scripts_dir}")
-    else:
-        errors.append("scr_path environment variable not set")
-    
-    # Method 3: Check current working directory
-    cwd = Path.cwd()
-    if (cwd / 'scripts' / '_models_data.py').exists():
-        scripts_dir = cwd / 'scripts'
-        print(f"✅ Found script path via CWD: {scripts_dir}")
-        return scripts_dir
-    
-    if cwd.name == 'scripts' and (cwd / '_models_data.py').exists():
-        print(f"✅ Found script path (CWD is scripts): {cwd}")
-        return cwd
-    
-    errors.append(f"Current working directory check failed: {cwd}")
+    yield "environment", env_path and os.path.join(env_path, 'scripts')
     
-    # Method 4: Try hardcoded paths
-    hardcoded_paths = [
-        Path('/content/LSDAI/scripts'),
-        Path('/content/LSDAI'),
-        Path('./LSDAI/scripts'),
-        Path('./scripts')
-    ]
+    cwd = os.getcwd()
+    yield "CWD", os.path.join(cwd, 'scripts')
+    if os.path.basename(cwd) == 'scripts':
+        yield "CWD (CWD is scripts)", cwd
     
-    for path in hardcoded_paths:
-        if path.exists() and (path / '_models_data.py').exists():
-            print(f"✅ Found script path via hardcoded path: {path}")
-            return path
-        elif path.exists():
-            errors.append(f"Hardcoded path exists but no _models_data.py: {path}")
+    for path in ('/content/LSDAI/scripts', '/content/LSDAI', './LSDAI/scripts', './scripts'):
+        yield "hardcoded path", path
+
+def find_script_path():
+    """Find the absolute path to the 'scripts' directory using multiple methods."""
+    errors = []
+    # One stat per candidate; the data file's presence implies the directory exists
+    for method, path in _script_path_candidates():
+        if not path:
+            errors.append(f"{method}: not available")
+        elif os.path.isfile(os.path.join(path, '_models_data.py')):
+            return _found_script_path(path, method)
         else:
-            errors.append(f"Hardcoded path does not exist: {path}")
+            errors.append(f"{method}: no _models_data.py in {path}")
     
     # All methods failed
-    error_msg = "Could not determine the script path.\\n\\nErrors encountered:\\n" + "\\n".join(f"  - {error}" for error in errors)
+    error_msg = "Could not determine the script path.\n\nErrors encountered:\n" + "\n".join(f"  - {error}" for error in errors)
     raise FileNotFoundError(error_msg)
 
 try:
     SCRIPTS = find_script_path()
     SCR_PATH = SCRIPTS.parent
     SETTINGS_PATH = SCR_PATH / 'settings.json'
+    MODELS_DATA_FILE = SCRIPTS / '_models_data.py'
+    XL_MODELS_DATA_FILE = SCRIPTS / '_xl_models_data.py'
     CSS = SCR_PATH / 'CSS'
     JS = SCR_PATH / 'JS'
     print(f"✅ Script path resolved: {SCRIPTS}")
@@ -89,47 +72,113 @@ except FileNotFoundError as e:
     print(f"FATAL ERROR: {e}")
     sys.exit(1)
 
-# Conditional imports for platform-specific features
-try:
-    from google.colab import output, drive
-    IN_COLAB = True
-except ImportError:
-    IN_COLAB = False
-    class DummyOutput:
-        @staticmethod
-        def register_callback(name, func):
-            pass
-    output = DummyOutput()
+# --- VERBOSITY INFO ---
+_VERBOSITY_LEVEL_INFO = {
+    VerbosityLevel.SILENT: {
+        "name": "Silent",
+        "desc": "Only critical errors shown",
+        "color": "#6b7280",
+        "affects": "❌ No subprocess output, ❌ No pip details, ❌ No download progress"
+    },
+    VerbosityLevel.MINIMAL: {
+        "name": "Minimal",
+        "desc": "Basic status messages only",
+        "color": "#374151",
+        "affects": "📝 Basic status, ❌ No command details, ❌ No pip output"
+    },
+    VerbosityLevel.NORMAL: {
+        "name": "Normal",
+        "desc": "Standard LSDAI output (default)",
+        "color": "#059669",
+        "affects": "📋 Standard messages, ❌ No command details, ❌ No subprocess output"
+    },
+    VerbosityLevel.DETAILED: {
+        "name": "Detailed",
+        "desc": "Show command outputs and technical details",
+        "color": "#0d9488",
+        "affects": "🔍 Command outputs, 📋 Technical details, ⚠️ Some subprocess output"
+    },
+    VerbosityLevel.VERBOSE: {
+        "name": "Verbose",
+        "desc": "Full debug information including pip outputs",
+        "color": "#0ea5e9",
+        "affects": "📊 Full debugging, 🔧 Pip outputs, 📋 All subprocess results"
+    },
+    VerbosityLevel.RAW: {
+        "name": "Raw Output",
+        "desc": "Everything including raw Python output",
+        "color": "#8b5cf6",
+        "affects": "🔧 Raw Python output, 📊 All subprocess streams, 🔍 Maximum detail"
+    }
+}
+
+# The info panel only ever shows one of these six blocks, so each one is
+# rendered the first time its level is displayed and reused afterwards
+@functools.lru_cache(maxsize=None)
+def _render_verbosity_info(level):
+    """Render the info panel HTML for a verbosity level."""
+    info = _VERBOSITY_LEVEL_INFO.get(level, _VERBOSITY_LEVEL_INFO[VerbosityLevel.NORMAL])
+    return f'''
+        <div style="padding: 10px; border-left: 4px solid {info["color"]}; background-color: #f8f9fa; margin: 10px 0;">
+            <strong style="color: {info["color"]};">{info["name"]} Mode</strong><br>
+            <em>{info["desc"]}</em><br>
+            <small style="color: #666;">{info["affects"]}</small><br>
+            <small style="color: #888; font-style: italic;">*Controls output detail level for ALL notebook cells and operations*</small>
+        </div>
+        '''
 
 # --- WIDGET MANAGER WITH VERBOSITY INTEGRATION - COMPLETE VERSION ---
 class WidgetManager:
     """Manages the creation, layout, and logic of the UI widgets with verbosity control."""
     
+    # Verbosity dropdown options and their lookups in both directions
+    _VERBOSITY_OPTIONS = (
+        ("Silent (Errors Only)", VerbosityLevel.SILENT),
+        ("Minimal (Basic Status)", VerbosityLevel.MINIMAL),
+        ("Normal (Standard Output)", VerbosityLevel.NORMAL),
+        ("Detailed (Show Commands)", VerbosityLevel.DETAILED),
+        ("Verbose (Full Debug)", VerbosityLevel.VERBOSE),
+        ("Raw (Everything)", VerbosityLevel.RAW)
+    )
+    _LEVEL_BY_TEXT = {text: level for text, level in _VERBOSITY_OPTIONS}
+    _TEXT_BY_LEVEL = {level: text for text, level in _VERBOSITY_OPTIONS}
+    _VERBOSITY_TEXTS = tuple(text for text, _ in _VERBOSITY_OPTIONS)
+    
+    # Widget keys for settings persistence, in restore order
+    settings_keys = (
+        'latest_webui', 'latest_extensions', 'change_webui', 'detailed_download',
+        'XL_models', 'inpainting_model', 'commit_hash', 'check_custom_nodes_deps',
+        'civitai_token', 'huggingface_token', 'zrok_token', 'ngrok_token',
+        'commandline_arguments', 'theme_accent', 'empowerment', 'empowerment_output',
+        'Model_url', 'Vae_url', 'LoRA_url', 'Embedding_url', 'Extensions_url',
+        'ADetailer_url', 'custom_file_urls', 'verbosity_level'
+    )
+    
+    # Persisted verbosity controls that mirror verbose_manager's own level; they are
+    # saved with the rest but never restored, since that would re-run set_verbosity
+    LIVE_STATE_KEYS = frozenset({'verbosity_level', 'detailed_download'})
+    
+    # WebUI command line argument templates
+    WEBUI_SELECTION = MappingProxyType({
+        'A1111': "--xformers --no-half-vae --share --lowram",
+        'ComfyUI': "--dont-print-server",
+        'Forge': "--xformers --cuda-stream --pin-shared-memory",
+        'Classic': "--persistent-patches --cuda-stream --pin-shared-memory",
+        'ReForge': "--xformers --cuda-stream --pin-shared-memory",
+        'SD-UX': "--xformers --no-half-vae"
+    })
+    
+    # Static dropdown options
+    WEBUI_OPTIONS = tuple(WEBUI_SELECTION)
+    THEME_OPTIONS = ('anxety', 'light', 'dark')
+
     def __init__(self):
         self.factory = WidgetFactory()
         self.widgets = {}
         self.selection_containers = {}
         self.verbose_manager = get_verbose_manager()
-        
-        # Define widget keys for settings persistence
-        self.settings_keys = [
-            'latest_webui', 'latest_extensions', 'change_webui', 'detailed_download',
-            'XL_models', 'inpainting_model', 'commit_hash', 'check_custom_nodes_deps',
-            'civitai_token', 'huggingface_token', 'zrok_token', 'ngrok_token',
-            'commandline_arguments', 'theme_accent', 'empowerment', 'empowerment_output',
-            'Model_url', 'Vae_url', 'LoRA_url', 'Embedding_url', 'Extensions_url',
-            'ADetailer_url', 'custom_file_urls', 'verbosity_level'
-        ]
-        
-        # WebUI command line argument templates
-        self.WEBUI_SELECTION = {
-            'A1111': "--xformers --no-half-vae --share --lowram",
-            'ComfyUI': "--dont-print-server",
-            'Forge': "--xformers --cuda-stream --pin-shared-memory",
-            'Classic': "--persistent-patches --cuda-stream --pin-shared-memory",
-            'ReForge': "--xformers --cuda-stream --pin-shared-memory",
-            'SD-UX': "--xformers --no-half-vae"
-        }
+        self._persisted_widgets = ()
+        self.save_button = None
 
     def read_model_data(self, file_path, data_type):
         """Read model data from the models data file with enhanced error handling."""
@@ -140,7 +189,6 @@ class WidgetManager:
             'lora': 'lora_list'
         }
         key = key_map.get(data_type)
-        local_vars = {}
         
         # Default fallback options
         fallback_options = {
@@ -156,25 +204,19 @@ class WidgetManager:
                 self.verbose_manager.print_if_verbose(f"Model data file not found: {file_path}", VerbosityLevel.DETAILED)
                 return fallback_options.get(data_type, ['none'])
             
-            # Try to read and execute the file
-            with open(file_path, 'r') as f:
-                file_content = f.read()
-            
-            # Execute in a controlled environment
-            exec(file_content, {}, local_vars)
-            
-            # Get the data
-            data = local_vars.get(key, {})
+            # The file is parsed once per modification; later calls reuse the cached names
+            data = mdu.read(file_path).get(key, {})
             
             if not isinstance(data, dict):
                 self.verbose_manager.print_if_verbose(f"Invalid data format for {data_type}: expected dict, got {type(data)}", VerbosityLevel.DETAILED)
                 return fallback_options.get(data_type, ['none'])
             
             # Extract keys (model names) and add defaults
-            options = list(fallback_options.get(data_type, ['none']))
-            options.extend(data.keys())
+            options = tuple(fallback_options.get(data_type, ['none'])) + mdu.read_names(file_path, key)
             
-            self.verbose_manager.print_if_verbose(f"Successfully loaded {len(options)-len(fallback_options.get(data_type, []))} {data_type} options", VerbosityLevel.DETAILED)
+            # Only build the message when it will actually be shown
+            if self.verbose_manager.should_show(VerbosityLevel.DETAILED):
+                print(f"Successfully loaded {len(options)-len(fallback_options.get(data_type, []))} {data_type} options")
             
             return options
             
@@ -182,8 +224,16 @@ class WidgetManager:
             self.verbose_manager.print_if_verbose(f"Error reading {data_type} data from {file_path}: {e}", VerbosityLevel.DETAILED)
             return fallback_options.get(data_type, ['none'])
 
-    def create_api_token_box(self, description, placeholder, url, env_var):
-        """Create an API token input box with help link."""
+    def read_model_lists(self, file_path, *data_types):
+        """Read several option lists from one models data file, which is parsed at most once."""
+        return {data_type: self.read_model_data(file_path, data_type) for data_type in data_types}
+
+    def create_api_token_box(self, description, placeholder, url, preset_value=None):
+        """Create an API token input box with help link.
+        
+        preset_value is the token already provided by the environment (looked
+        up once by the caller), which locks the input when set.
+        """
         widget = self.factory.create_text(
             value='',
             description=description,
@@ -191,8 +241,7 @@ class WidgetManager:
         )
         
         # Check if token already set in environment
-        token_from_env = os.getenv(env_var)
-        if token_from_env:
+        if preset_value:
             widget.value = "Token set in Cell 1"
             widget.disabled = True
         
@@ -202,25 +251,11 @@ class WidgetManager:
     def create_verbosity_control_section(self):
         """Create the verbosity control section for the UI - FULLY WORKING VERSION"""
         # Create verbosity level dropdown with proper mapping
-        verbosity_options = [
-            ("Silent (Errors Only)", VerbosityLevel.SILENT),
-            ("Minimal (Basic Status)", VerbosityLevel.MINIMAL),
-            ("Normal (Standard Output)", VerbosityLevel.NORMAL),
-            ("Detailed (Show Commands)", VerbosityLevel.DETAILED),
-            ("Verbose (Full Debug)", VerbosityLevel.VERBOSE),
-            ("Raw (Everything)", VerbosityLevel.RAW)
-        ]
-        
-        # Find current level name
         current_level = self.verbose_manager.verbosity_level
-        current_text = "Normal (Standard Output)"  # Default
-        for text, level in verbosity_options:
-            if level == current_level:
-                current_text = text
-                break
+        current_text = self._TEXT_BY_LEVEL.get(current_level, "Normal (Standard Output)")
         
         self.widgets['verbosity_level'] = self.factory.create_dropdown(
-            options=[opt[0] for opt in verbosity_options],
+            options=self._VERBOSITY_TEXTS,
             value=current_text,
             description='Output Level:'
         )
@@ -281,33 +316,18 @@ class WidgetManager:
 
     def _on_verbosity_dropdown_change(self, change):
         """Handle verbosity dropdown change - FIXED TO ACTUALLY UPDATE"""
-        verbosity_options = [
-            ("Silent (Errors Only)", VerbosityLevel.SILENT),
-            ("Minimal (Basic Status)", VerbosityLevel.MINIMAL),
-            ("Normal (Standard Output)", VerbosityLevel.NORMAL),
-            ("Detailed (Show Commands)", VerbosityLevel.DETAILED),
-            ("Verbose (Full Debug)", VerbosityLevel.VERBOSE),
-            ("Raw (Everything)", VerbosityLevel.RAW)
-        ]
-        
         # Find the verbosity level based on the selected option
-        selected_text = change['new']
-        new_level = VerbosityLevel.NORMAL  # Default
-        
-        for text, level in verbosity_options:
-            if text == selected_text:
-                new_level = level
-                break
+        new_level = self._LEVEL_BY_TEXT.get(change['new'], VerbosityLevel.NORMAL)
         
         # Update verbosity manager - THIS ACTUALLY WORKS NOW
         self.verbose_manager.set_verbosity(new_level)
         
-        # Update other widgets to match
-        self.widgets['detailed_download'].value = (new_level >= VerbosityLevel.DETAILED)
-        self.widgets['detailed_download'].button_style = 'success' if (new_level >= VerbosityLevel.DETAILED) else ''
-        
-        # Update info display
-        self.verbosity_info.value = self._get_verbosity_info_html()
+        # Update other widgets to match (batched into a single frontend sync and notification pass)
+        is_detailed = new_level >= VerbosityLevel.DETAILED
+        with self.factory.batch_update(self.widgets['detailed_download'], self.verbosity_info):
+            self.widgets['detailed_download'].value = is_detailed
+            self.widgets['detailed_download'].button_style = 'success' if is_detailed else ''
+            self.verbosity_info.value = self._get_verbosity_info_html()
         
         # Show notification
         level_name = self.verbose_manager.get_current_level_name()
@@ -315,26 +335,17 @@ class WidgetManager:
 
     def _on_detailed_toggle_change(self, change):
         """Handle detailed toggle change"""
-        if change['new']:
-            # Enable detailed mode
-            self.verbose_manager.set_verbosity(VerbosityLevel.DETAILED)
-            self.widgets['detailed_download'].button_style = 'success'
-            self.show_notification("Detailed output enabled", "info")
-        else:
-            # Set to normal mode
-            self.verbose_manager.set_verbosity(VerbosityLevel.NORMAL)
-            self.widgets['detailed_download'].button_style = ''
-            self.show_notification("Detailed output disabled", "info")
+        # Enable detailed mode or fall back to normal mode
+        enabled = change['new']
+        new_level = VerbosityLevel.DETAILED if enabled else VerbosityLevel.NORMAL
+        self.verbose_manager.set_verbosity(new_level)
         
-        # Update dropdown to match
-        level_name = self.verbose_manager.get_current_level_name()
-        verbosity_text = f"{level_name} ({['Errors Only', 'Basic Status', 'Standard Output', 'Show Commands', 'Full Debug', 'Everything'][self.verbose_manager.verbosity_level]})"
+        # Update toggle style and dropdown to match (batched into a single frontend sync)
+        with self.factory.hold_sync(self.widgets['detailed_download'], self.widgets['verbosity_level']):
+            self.widgets['detailed_download'].button_style = 'success' if enabled else ''
+            self.widgets['verbosity_level'].value = self._TEXT_BY_LEVEL[new_level]
         
-        # Find matching dropdown option
-        for option in self.widgets['verbosity_level'].options:
-            if level_name.lower() in option.lower():
-                self.widgets['verbosity_level'].value = option
-                break
+        self.show_notification(f"Detailed output {'enabled' if enabled else 'disabled'}", "info")
 
     def _on_realtime_toggle_change(self, change):
         """Handle real-time output toggle change"""
@@ -349,26 +360,28 @@ class WidgetManager:
         """Demonstrate the current verbosity level - COMPREHENSIVE TEST"""
         self.show_notification("Testing current verbosity level...", "info")
         
-        print("=" * 50)
-        print("🔧 VERBOSITY LEVEL TEST")
-        print("=" * 50)
-        
+        banner = "=" * 50
         current_level = self.verbose_manager.verbosity_level
         level_name = self.verbose_manager.get_current_level_name()
-        print(f"Current level: {level_name} ({current_level})")
-        print()
-        
-        # Test each verbosity level
-        print("Testing what each level displays:")
-        self.verbose_manager.print_if_verbose("❌ Silent level: This only shows on errors", VerbosityLevel.SILENT)
-        self.verbose_manager.print_if_verbose("📝 Minimal level: Basic status messages", VerbosityLevel.MINIMAL)
-        self.verbose_manager.print_if_verbose("📋 Normal level: Standard LSDAI output", VerbosityLevel.NORMAL)
-        self.verbose_manager.print_if_verbose("🔍 Detailed level: Command outputs and details", VerbosityLevel.DETAILED)
-        self.verbose_manager.print_if_verbose("📊 Verbose level: Full debug information", VerbosityLevel.VERBOSE)
-        self.verbose_manager.print_if_verbose("🔧 Raw level: Literally everything, no filtering", VerbosityLevel.RAW)
         
-        print()
-        print("Testing subprocess execution:")
+        # Test each verbosity level; the visible lines go out as one block
+        level_lines = [
+            line for line, level in (
+                ("❌ Silent level: This only shows on errors", VerbosityLevel.SILENT),
+                ("📝 Minimal level: Basic status messages", VerbosityLevel.MINIMAL),
+                ("📋 Normal level: Standard LSDAI output", VerbosityLevel.NORMAL),
+                ("🔍 Detailed level: Command outputs and details", VerbosityLevel.DETAILED),
+                ("📊 Verbose level: Full debug information", VerbosityLevel.VERBOSE),
+                ("🔧 Raw level: Literally everything, no filtering", VerbosityLevel.RAW)
+            )
+            if self.verbose_manager.should_show(level)
+        ]
+        print("\n".join([
+            banner, "🔧 VERBOSITY LEVEL TEST", banner,
+            f"Current level: {level_name} ({current_level})", "",
+            "Testing what each level displays:", *level_lines, "",
+            "Testing subprocess execution:"
+        ]))
         
         # Demonstrate a subprocess call
         try:
@@ -376,75 +389,17 @@ class WidgetManager:
         except Exception as e:
             print(f"Demo command failed: {e}")
         
-        print()
-        print("✅ Verbosity test completed!")
-        print("=" * 50)
+        print(f"\n✅ Verbosity test completed!\n{banner}")
         
         # Reset button state
         button.value = False
 
     def _get_verbosity_info_html(self) -> str:
         """Get HTML description of current verbosity level"""
-        level_info = {
-            VerbosityLevel.SILENT: {
-                "name": "Silent",
-                "desc": "Only critical errors shown",
-                "color": "#6b7280",
-                "affects": "❌ No subprocess output, ❌ No pip details, ❌ No download progress"
-            },
-            VerbosityLevel.MINIMAL: {
-                "name": "Minimal",
-                "desc": "Basic status messages only",
-                "color": "#374151",
-                "affects": "📝 Basic status, ❌ No command details, ❌ No pip output"
-            },
-            VerbosityLevel.NORMAL: {
-                "name": "Normal",
-                "desc": "Standard LSDAI output (default)",
-                "color": "#059669",
-                "affects": "📋 Standard messages, ❌ No command details, ❌ No subprocess output"
-            },
-            VerbosityLevel.DETAILED: {
-                "name": "Detailed",
-                "desc": "Show command outputs and technical details",
-                "color": "#0d9488",
-                "affects": "🔍 Command outputs, 📋 Technical details, ⚠️ Some subprocess output"
-            },
-            VerbosityLevel.VERBOSE: {
-                "name": "Verbose",
-                "desc": "Full debug information including pip outputs",
-                "color": "#0ea5e9",
-                "affects": "📊 Full debugging, 🔧 Pip outputs, 📋 All subprocess results"
-            },
-            VerbosityLevel.RAW: {
-                "name": "Raw Output",
-                "desc": "Everything including raw Python output",
-                "color": "#8b5cf6",
-                "affects": "🔧 Raw Python output, 📊 All subprocess streams, 🔍 Maximum detail"
-            }
-        }
-        
-        current_level = self.verbose_manager.verbosity_level
-        info = level_info.get(current_level, level_info[VerbosityLevel.NORMAL])
-        
-        return f'''
-        <div style="padding: 10px; border-left: 4px solid {info["color"]}; background-color: #f8f9fa; margin: 10px 0;">
-            <strong style="color: {info["color"]};">{info["name"]} Mode</strong><br>
-            <em>{info["desc"]}</em><br>
-            <small style="color: #666;">{info["affects"]}</small><br>
-            <small style="color: #888; font-style: italic;">*Controls output detail level for ALL notebook cells and operations*</small>
-        </div>
-        '''
+        return _render_verbosity_info(self.verbose_manager.verbosity_level)
 
     def show_notification(self, message, notification_type="info"):
         """Show a notification message."""
-        colors = {
-            "info": "#0ea5e9",
-            "success": "#059669", 
-            "warning": "#d97706",
-            "error": "#dc2626"
-        }
-        color = colors.get(notification_type, colors["info"])
         print(f"🔔 {message}")
 
     def create_widgets(self):
@@ -452,47 +407,35 @@ class WidgetManager:
         print("🔧 Creating widgets...")
         
         # Model data file
-        model_data_file = SCRIPTS / '_models_data.py'
+        model_data_file = MODELS_DATA_FILE
         
         # --- WebUI Selection ---
-        webui_options = ['A1111', 'ComfyUI', 'Forge', 'Classic', 'ReForge', 'SD-UX']
         self.widgets['change_webui'] = self.factory.create_dropdown(
-            webui_options, 'A1111', 'WebUI:'
+            self.WEBUI_OPTIONS, 'A1111', 'WebUI:'
         )
         
         # --- Model Selection ---
         self.widgets['XL_models'] = self.factory.create_checkbox(False, 'XL Models')
         
+        # All option lists come from a single parse of the data file
         try:
-            model_options = self.read_model_data(model_data_file, 'model')
+            options = self.read_model_lists(model_data_file, 'model', 'vae', 'lora')
         except Exception as e:
             self.verbose_manager.print_if_verbose(f"Error loading model data: {e}", VerbosityLevel.DETAILED)
-            model_options = ['none']
+            options = {'model': ['none'], 'vae': ['none', 'ALL'], 'lora': ['none', 'ALL']}
         
         self.widgets['model'] = self.factory.create_dropdown(
-            model_options, 'none', 'Model:'
+            options['model'], 'none', 'Model:'
         )
         
         # --- VAE Selection ---
-        try:
-            vae_options = self.read_model_data(model_data_file, 'vae')
-        except Exception as e:
-            self.verbose_manager.print_if_verbose(f"Error loading VAE data: {e}", VerbosityLevel.DETAILED)
-            vae_options = ['none', 'ALL']
-        
         self.widgets['vae'] = self.factory.create_dropdown(
-            vae_options, 'none', 'VAE:'
+            options['vae'], 'none', 'VAE:'
         )
         
         # --- LoRA Selection ---
-        try:
-            lora_options = self.read_model_data(model_data_file, 'lora')
-        except Exception as e:
-            self.verbose_manager.print_if_verbose(f"Error loading LoRA data: {e}", VerbosityLevel.DETAILED)
-            lora_options = ['none', 'ALL']
-        
         self.widgets['lora'] = self.factory.create_dropdown(
-            lora_options, 'none', 'LoRA:'
+            options['lora'], 'none', 'LoRA:'
         )
         
         # --- Installation Options ---
@@ -500,25 +443,24 @@ class WidgetManager:
         self.widgets['latest_extensions'] = self.factory.create_checkbox(False, 'Latest Extensions')
         
         # --- Custom URLs ---
-        self.widgets['Model_url'] = self.factory.create_text('', 'Model URLs (comma-separated):')
-        self.widgets['Vae_url'] = self.factory.create_text('', 'VAE URLs:')
-        self.widgets['LoRA_url'] = self.factory.create_text('', 'LoRA URLs:')
-        self.widgets['Embedding_url'] = self.factory.create_text('', 'Embedding URLs:')
-        self.widgets['Extensions_url'] = self.factory.create_text('', 'Extension URLs:')
-        
-        # --- API Tokens ---
-        self.widgets['civitai_token'] = self.factory.create_text('', 'CivitAI Token:')
-        self.widgets['huggingface_token'] = self.factory.create_text('', 'HuggingFace Token:')
-        
-        # --- Launch Arguments ---
-        self.widgets['commandline_arguments'] = self.factory.create_text(
-            '', 'Launch Arguments:'
-        )
+        self.widgets.update(self.factory.create_many([
+            ('Model_url', 'text', '', 'Model URLs (comma-separated):'),
+            ('Vae_url', 'text', '', 'VAE URLs:'),
+            ('LoRA_url', 'text', '', 'LoRA URLs:'),
+            ('Embedding_url', 'text', '', 'Embedding URLs:'),
+            ('Extensions_url', 'text', '', 'Extension URLs:')
+        ]))
+        
+        # --- API Tokens and Launch Arguments ---
+        self.widgets.update(self.factory.create_many([
+            ('civitai_token', 'text', '', 'CivitAI Token:'),
+            ('huggingface_token', 'text', '', 'HuggingFace Token:'),
+            ('commandline_arguments', 'text', '', 'Launch Arguments:')
+        ]))
         
         # --- Theme ---
-        theme_options = ['anxety', 'light', 'dark']
         self.widgets['theme_accent'] = self.factory.create_dropdown(
-            theme_options, 'anxety', 'Theme:'
+            self.THEME_OPTIONS, 'anxety', 'Theme:'
         )
         
         print("✅ Widgets created successfully")
@@ -566,12 +508,15 @@ class WidgetManager:
         verbosity_section = self.create_verbosity_control_section()
         
         # Control buttons
+        # Disabled until main() has restored the saved values, so a click can't overwrite them with defaults
         save_button = widgets.Button(
             description='💾 Save Settings',
             button_style='success',
+            disabled=True,
             layout=widgets.Layout(width='200px')
         )
         save_button.on_click(lambda b: self.save_settings())
+        self.save_button = save_button
         
         buttons_section = self.factory.create_hbox([save_button])
         
@@ -586,18 +531,22 @@ class WidgetManager:
             buttons_section
         ])
         
+        # All persisted widgets exist now (verbosity controls are built with the layout)
+        self._persisted_widgets = tuple(
+            (key, self.widgets[key]) for key in self.settings_keys
+            if key in self.widgets and hasattr(self.widgets[key], 'value')
+        )
+        
         print("✅ Layout created successfully")
         return main_layout
 
     def save_settings(self):
         """Save current widget values to settings."""
         try:
-            settings_data = {}
-            for key in self.settings_keys:
-                if key in self.widgets and hasattr(self.widgets[key], 'value'):
-                    settings_data[key] = self.widgets[key].value
+            settings_data = {key: widget.value for key, widget in self._persisted_widgets}
             
-            js.write(SETTINGS_PATH, 'WIDGETS', settings_data)
+            if not js.save_section(SETTINGS_PATH, 'WIDGETS', settings_data):
+                raise IOError(f"Could not write {SETTINGS_PATH}")
             self.show_notification("Settings saved successfully!", "success")
             
         except Exception as e:
@@ -606,12 +555,27 @@ class WidgetManager:
     def load_settings(self):
         """Load settings from JSON file."""
         try:
-            for key in self.settings_keys:
-                if key in self.widgets:
-                    value = js.read(SETTINGS_PATH, f'WIDGETS.{key}')
-                    if value is not None:
-                        if hasattr(self.widgets[key], 'value'):
-                            self.widgets[key].value = value
+            saved = js.read_cached(SETTINGS_PATH).get('WIDGETS', {})
+            restore = {}
+            # _persisted_widgets already holds only the widgets with a value
+            for key, widget in self._persisted_widgets:
+                value = saved.get(key)
+                if value is None or key in self.LIVE_STATE_KEYS:
+                    continue
+                # JSON gives lists back for tuples; values of the wrong type are skipped
+                try:
+                    value = self.factory.coerce_value(widget, value)
+                except ValueError as e:
+                    self.verbose_manager.print_if_verbose(f"Warning: Skipping saved {key}: {e}", VerbosityLevel.DETAILED)
+                    continue
+                # Only touch widgets whose value actually changes
+                if widget.value != value:
+                    restore[key] = value
+            
+            # Restored values reach the frontend as one batch on exit
+            with self.factory.hold_sync(*(self.widgets[key] for key in restore)):
+                for key, value in restore.items():
+                    self.widgets[key].value = value
         except Exception as e:
             self.verbose_manager.print_if_verbose(f"Warning: Could not load some settings: {e}", VerbosityLevel.DETAILED)
 
@@ -627,24 +591,29 @@ class WidgetManager:
         # XL models toggle callback
         def update_xl_options(change):
             # Update model options based on XL toggle
-            model_data_file = SCRIPTS / ('_xl_models_data.py' if change.get('new') else '_models_data.py')
+            model_data_file = XL_MODELS_DATA_FILE if change.get('new') else MODELS_DATA_FILE
             try:
                 model_options = self.read_model_data(model_data_file, 'model')
                 if 'model' in self.widgets:
-                    self.widgets['model'].options = model_options
-                    self.widgets['model'].value = model_options[0] if model_options else 'none'
+                    # Options and value reset go out as one frontend update
+                    with self.factory.hold_sync(self.widgets['model']):
+                        self.widgets['model'].options = model_options
+                        self.widgets['model'].value = model_options[0] if model_options else 'none'
             except Exception as e:
                 self.verbose_manager.print_if_verbose(f"Error updating XL options: {e}", VerbosityLevel.DETAILED)
         
         if 'XL_models' in self.widgets:
-            self.widgets['XL_models'].observe(update_xl_options, names='value')
+            # Rapid toggling collapses into a single options update for the final state
+            self.widgets['XL_models'].observe(
+                lambda change: self.factory.debounce('XL_models', 0.1, update_xl_options, change),
+                names='value'
+            )
 
 # --- MAIN EXECUTION ---
 def main():
     """Main function to create and display the widget interface"""
     
-    print("🎯 LSDAI Enhanced Widget Interface")
-    print("=" * 40)
+    print("🎯 LSDAI Enhanced Widget Interface\n" + "=" * 40)
     
     try:
         # Initialize widget manager
@@ -653,16 +622,22 @@ def main():
         # Create widgets
         wm.create_widgets()
         
-        # Load existing settings
-        wm.load_settings()
-        
-        # Setup callbacks
-        wm.setup_callbacks()
-        
         # Create and display layout
         layout = wm.create_layout()
         display(layout)
         
+        # Restore saved values and wire callbacks once the UI has painted
+        def finish_setup():
+            try:
+                wm.load_settings()
+                wm.setup_callbacks()
+                wm.save_button.disabled = False
+            except Exception as e:
+                # Saving stays disabled; nothing else would surface an error raised on this thread
+                wm.verbose_manager.print_if_verbose(f"❌ Error restoring widget settings: {e}", VerbosityLevel.SILENT)
+        
+        threading.Thread(target=finish_setup, daemon=True).start()
+        
         print("✅ Enhanced widget interface loaded successfully!")
         
     except Exception as e:
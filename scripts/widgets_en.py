@@ -4,13 +4,15 @@
 from widget_factory import WidgetFactory
 from webui_utils import update_current_webui
 import json_utils as js
+import model_data_utils as mdu
 
 from IPython.display import display, Javascript, HTML
 import ipywidgets as widgets
 from pathlib import Path
-import importlib.util
+import html
 import json
 import os
+import time
 
 # Conditional imports for platform-specific features
 try:
@@ -33,6 +35,8 @@ SCR_PATH = PATHS['scr_path']
 SETTINGS_PATH = SCR_PATH / 'settings.json'
 ENV_NAME = js.read(SETTINGS_PATH, 'ENVIRONMENT.env_name')
 SCRIPTS = SCR_PATH / 'scripts'
+MODELS_DATA_FILE = SCRIPTS / '_models_data.py'
+XL_MODELS_DATA_FILE = SCRIPTS / '_xl_models_data.py'
 
 CSS = SCR_PATH / 'CSS'
 JS = SCR_PATH / 'JS'
@@ -40,18 +44,25 @@ widgets_css = CSS / 'main-widgets.css'
 widgets_js = JS / 'main-widgets.js'
 
 class WidgetManager:
+    # Widget keys for settings persistence, in restore order
+    settings_keys = (
+        'XL_models', 'model', 'model_num', 'inpainting_model', 'vae', 'vae_num', 'lora',
+        'latest_webui', 'latest_extensions', 'check_custom_nodes_deps', 'change_webui', 'detailed_download',
+        'controlnet', 'controlnet_num', 'commit_hash',
+        'civitai_token', 'huggingface_token', 'zrok_token', 'ngrok_token', 'commandline_arguments', 'theme_accent',
+        'empowerment', 'empowerment_output',
+        'Model_url', 'Vae_url', 'LoRA_url', 'Embedding_url', 'Extensions_url', 'ADetailer_url',
+        'custom_file_urls'
+    )
+    
+    # Static dropdown options
+    WEBUI_OPTIONS = ('automatic1111', 'ComfyUI')
+    THEME_OPTIONS = ('anxety', 'light', 'dark')
+
     def __init__(self):
         self.factory = WidgetFactory()
         self.widgets = {}
-        self.settings_keys = [
-            'XL_models', 'model', 'model_num', 'inpainting_model', 'vae', 'vae_num', 'lora',
-            'latest_webui', 'latest_extensions', 'check_custom_nodes_deps', 'change_webui', 'detailed_download',
-            'controlnet', 'controlnet_num', 'commit_hash',
-            'civitai_token', 'huggingface_token', 'zrok_token', 'ngrok_token', 'commandline_arguments', 'theme_accent',
-            'empowerment', 'empowerment_output',
-            'Model_url', 'Vae_url', 'LoRA_url', 'Embedding_url', 'Extensions_url', 'ADetailer_url',
-            'custom_file_urls'
-        ]
+        self._persisted_widgets = ()
 
     def create_expandable_button(self, text, url):
         """Create expandable API token button like original."""
@@ -64,72 +75,63 @@ class WidgetManager:
 
     def read_model_data(self, file_path, data_type):
         """
-        Read model data safely using importlib.
+        Read model data safely by parsing the data file's literals.
         FIXED: This logic is now more robust and only extracts model names (keys)
         to prevent 'unhashable type: dict' errors with ipywidgets.
         """
         type_map = {
-            'model': ('model_list', ['none']),
-            'vae': ('vae_list', ['none', 'ALL']),
-            'cnet': ('controlnet_list', ['none', 'ALL']),
-            'lora': ('lora_list', ['none', 'ALL'])
+            'model': ('model_list', ('none',)),
+            'vae': ('vae_list', ('none', 'ALL')),
+            'cnet': ('controlnet_list', ('none', 'ALL')),
+            'lora': ('lora_list', ('none', 'ALL'))
         }
         key, prefixes = type_map[data_type]
         
         try:
-            spec = importlib.util.spec_from_file_location("model_data", file_path)
-            model_data_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(model_data_module)
-            data_dict = getattr(model_data_module, key, {})
-            if not isinstance(data_dict, dict):
-                raise TypeError(f"Data for '{key}' is not a dictionary.")
-            
-            # Build options list using only the keys (names) from the data dictionary.
-            options = list(prefixes)
-            options.extend(data_dict.keys())
-            
-            return options
+            # Build options using only the keys (names) from the data dictionary.
+            return prefixes + mdu.read_names(file_path, key)
         except Exception as e:
             print(f"Error reading {data_type} data: {e}")
             return list(prefixes)
 
+    def read_model_lists(self, file_path, *data_types):
+        """Read several option lists from one models data file, which is parsed at most once."""
+        return {data_type: self.read_model_data(file_path, data_type) for data_type in data_types}
+
     def create_widgets(self):
         """Create all widgets for the interface."""
         
         # Model data file
-        model_data_file = SCRIPTS / '_models_data.py'
+        model_data_file = MODELS_DATA_FILE
         
         # --- WebUI Selection ---
-        webui_options = ['automatic1111', 'ComfyUI']
         self.widgets['change_webui'] = self.factory.create_dropdown(
-            webui_options, 'automatic1111', 'WebUI:'
+            self.WEBUI_OPTIONS, 'automatic1111', 'WebUI:'
         )
         
         # --- Model Selection ---
         xl_models_toggle = self.factory.create_checkbox(False, 'XL Models')
         self.widgets['XL_models'] = xl_models_toggle
         
-        model_options = self.read_model_data(model_data_file, 'model')
+        # All option lists come from a single parse of the data file
+        options = self.read_model_lists(model_data_file, 'model', 'vae', 'lora', 'cnet')
         self.widgets['model'] = self.factory.create_dropdown_multiple(
-            model_options, ['none'], 'Model:'
+            options['model'], ['none'], 'Model:'
         )
         
         # --- VAE Selection ---
-        vae_options = self.read_model_data(model_data_file, 'vae')
         self.widgets['vae'] = self.factory.create_dropdown_multiple(
-            vae_options, ['none'], 'VAE:'
+            options['vae'], ['none'], 'VAE:'
         )
         
         # --- LoRA Selection ---
-        lora_options = self.read_model_data(model_data_file, 'lora')
         self.widgets['lora'] = self.factory.create_dropdown_multiple(
-            lora_options, ['none'], 'LoRA:'
+            options['lora'], ['none'], 'LoRA:'
         )
         
         # --- ControlNet Selection ---
-        controlnet_options = self.read_model_data(model_data_file, 'cnet')
         self.widgets['controlnet'] = self.factory.create_dropdown_multiple(
-            controlnet_options, ['none'], 'ControlNet:'
+            options['cnet'], ['none'], 'ControlNet:'
         )
         
         # --- Installation Options ---
@@ -138,25 +140,29 @@ class WidgetManager:
         self.widgets['detailed_download'] = self.factory.create_checkbox(False, 'Detailed Download')
         
         # --- Custom URLs ---
-        self.widgets['Model_url'] = self.factory.create_text('', 'Model URLs (comma-separated):')
-        self.widgets['Vae_url'] = self.factory.create_text('', 'VAE URLs:')
-        self.widgets['LoRA_url'] = self.factory.create_text('', 'LoRA URLs:')
-        self.widgets['Embedding_url'] = self.factory.create_text('', 'Embedding URLs:')
-        self.widgets['Extensions_url'] = self.factory.create_text('', 'Extension URLs:')
-        
-        # --- API Tokens ---
-        self.widgets['civitai_token'] = self.factory.create_text('', 'CivitAI Token:')
-        self.widgets['huggingface_token'] = self.factory.create_text('', 'HuggingFace Token:')
-        
-        # --- Launch Arguments ---
-        self.widgets['commandline_arguments'] = self.factory.create_text(
-            '', 'Launch Arguments:'
-        )
+        self.widgets.update(self.factory.create_many([
+            ('Model_url', 'text', '', 'Model URLs (comma-separated):'),
+            ('Vae_url', 'text', '', 'VAE URLs:'),
+            ('LoRA_url', 'text', '', 'LoRA URLs:'),
+            ('Embedding_url', 'text', '', 'Embedding URLs:'),
+            ('Extensions_url', 'text', '', 'Extension URLs:')
+        ]))
+        
+        # --- API Tokens and Launch Arguments ---
+        self.widgets.update(self.factory.create_many([
+            ('civitai_token', 'text', '', 'CivitAI Token:'),
+            ('huggingface_token', 'text', '', 'HuggingFace Token:'),
+            ('commandline_arguments', 'text', '', 'Launch Arguments:')
+        ]))
         
         # --- Theme ---
-        theme_options = ['anxety', 'light', 'dark']
         self.widgets['theme_accent'] = self.factory.create_dropdown(
-            theme_options, 'anxety', 'Theme:'
+            self.THEME_OPTIONS, 'anxety', 'Theme:'
+        )
+        
+        self._persisted_widgets = tuple(
+            (key, self.widgets[key]) for key in self.settings_keys
+            if key in self.widgets and hasattr(self.widgets[key], 'value')
         )
         
         # Load existing values from settings
@@ -165,17 +171,24 @@ class WidgetManager:
         # Setup callbacks
         self.setup_callbacks()
 
-    def setup_callbacks(self):
-        """Setup widget callbacks and interactions."""
+    def update_xl_options(self, xl_enabled):
+        """Swap the model options to the SD1.5 or XL list and reset the selection."""
+        model_data_file = XL_MODELS_DATA_FILE if xl_enabled else MODELS_DATA_FILE
         
-        # XL models toggle callback
-        def update_xl_options(change):
-            model_data_file = SCRIPTS / ('_xl_models_data.py' if change.get('new') else '_models_data.py')
-            
+        # Options and value reset go out as one frontend update
+        with self.factory.hold_sync(self.widgets['model']):
             self.widgets['model'].options = self.read_model_data(model_data_file, 'model')
             self.widgets['model'].value = ['none']
+
+    def on_xl_toggle(self, change):
+        """XL checkbox observer; rapid toggling collapses into one update for the final state."""
+        self.factory.debounce('XL_models', 0.1, self.update_xl_options, change.get('new'))
+
+    def setup_callbacks(self):
+        """Setup widget callbacks and interactions."""
         
-        self.widgets['XL_models'].observe(update_xl_options, names='value')
+        # XL models toggle callback
+        self.widgets['XL_models'].observe(self.on_xl_toggle, names='value')
         
         # WebUI change callback
         def update_webui_options(change):
@@ -186,25 +199,40 @@ class WidgetManager:
     def load_settings(self):
         """Load settings from JSON file."""
         try:
-            for key in self.settings_keys:
-                if key in self.widgets:
-                    value = js.read(SETTINGS_PATH, f'WIDGETS.{key}')
-                    if value is not None:
-                        if hasattr(self.widgets[key], 'value'):
-                            self.widgets[key].value = value
+            saved = js.read_cached(SETTINGS_PATH).get('WIDGETS', {})
+            restore = {}
+            # _persisted_widgets already holds only the widgets with a value
+            for key, widget in self._persisted_widgets:
+                value = saved.get(key)
+                if value is None:
+                    continue
+                # JSON gives lists back for tuples; values of the wrong type are skipped
+                try:
+                    value = self.factory.coerce_value(widget, value)
+                except ValueError as e:
+                    print(f"Warning: Skipping saved {key}: {e}")
+                    continue
+                # Only touch widgets whose value actually changes
+                if widget.value != value:
+                    restore[key] = value
+            
+            # Restored values reach the frontend as one batch on exit
+            with self.factory.hold_sync(*(self.widgets[key] for key in restore)):
+                for key, value in restore.items():
+                    self.widgets[key].value = value
         except Exception as e:
             print(f"Warning: Could not load some settings: {e}")
 
     def save_settings(self):
-        """Save current widget values to settings."""
+        """Save current widget values to settings and return them (None on failure)."""
         try:
-            settings_data = {}
-            for key in self.settings_keys:
-                if key in self.widgets and hasattr(self.widgets[key], 'value'):
-                    settings_data[key] = self.widgets[key].value
+            # Selections (model/vae/lora/controlnet) are SelectMultiple tuples
+            settings_data = {key: widget.value for key, widget in self._persisted_widgets}
             
-            js.write(SETTINGS_PATH, 'WIDGETS', settings_data)
+            if not js.save_section(SETTINGS_PATH, 'WIDGETS', settings_data):
+                raise IOError(f"Could not write {SETTINGS_PATH}")
             show_notification("Settings saved successfully!", "success")
+            return settings_data
             
         except Exception as e:
             show_notification(f"Error saving settings: {e}", "error")
@@ -270,26 +298,29 @@ class WidgetManager:
         )
         export_button.on_click(export_settings)
         
-        import_button = widgets.Button(
-            description='📥 Import Settings',
-            button_style='warning',
-            layout=widgets.Layout(width='200px')
-        )
-        import_button.on_click(import_settings)
-        
-        buttons_section = widgets.HBox([
-            save_button, export_button, import_button
-        ], layout=widgets.Layout(justify_content='center'))
+        buttons = [save_button, export_button]
         
-        # Google Drive Mount (Colab only)
+        # Importing goes through the Colab file picker, so only build it there
         if IN_COLAB:
+            import_button = widgets.Button(
+                description='📥 Import Settings',
+                button_style='warning',
+                layout=widgets.Layout(width='200px')
+            )
+            import_button.on_click(import_settings)
+            buttons.append(import_button)
+            
+            # Google Drive Mount
             mount_button = widgets.Button(
                 description='📂 Mount Google Drive',
                 button_style='primary',
                 layout=widgets.Layout(width='200px')
             )
             mount_button.on_click(mount_google_drive)
-            buttons_section.children = buttons_section.children + (mount_button,)
+            buttons.append(mount_button)
+        
+        # Build the row once with its final children instead of patching it afterwards
+        buttons_section = widgets.HBox(buttons, layout=widgets.Layout(justify_content='center'))
         
         # Main layout
         main_layout = widgets.VBox([
@@ -321,15 +352,14 @@ def mount_google_drive(button=None):
 def export_settings(button=None):
     """Export settings to JSON"""
     try:
-        # Save current settings first
-        wm.save_settings()
-        
-        # Read all settings
-        all_settings = js.read(SETTINGS_PATH)
+        # Save current settings first; the saved values are exactly what gets exported
+        widget_settings = wm.save_settings()
+        if widget_settings is None:
+            widget_settings = js.read_cached(SETTINGS_PATH).get('WIDGETS', {})
         
         # Create export data
         export_data = {
-            'widgets': all_settings.get('WIDGETS', {}),
+            'widgets': widget_settings,
             'timestamp': int(time.time()),
             'version': '2.0'
         }
@@ -361,12 +391,28 @@ def apply_imported_settings(data):
     """Apply imported settings data"""
     try:
         if 'widgets' in data:
-            for key, value in data['widgets'].items():
-                if key in wm.settings_keys and key in wm.widgets:
-                    try:
-                        wm.widgets[key].value = value
-                    except Exception as e:
-                        print(f"Warning: Could not set {key}: {e}")
+            imported = data['widgets']
+            xl_toggle = wm.widgets['XL_models']
+            
+            # The debounced XL observer would reset the model after it is restored,
+            # so it is unhooked and the option swap runs inline, in settings_keys order
+            xl_toggle.unobserve(wm.on_xl_toggle, names='value')
+            try:
+                with wm.factory.hold_sync(*wm.widgets.values()):
+                    for key in wm.settings_keys:
+                        if key not in imported or key not in wm.widgets:
+                            continue
+                        widget = wm.widgets[key]
+                        try:
+                            value = wm.factory.coerce_value(widget, imported[key])
+                            if widget.value != value:
+                                widget.value = value
+                                if widget is xl_toggle:
+                                    wm.update_xl_options(value)
+                        except Exception as e:
+                            print(f"Warning: Could not set {key}: {e}")
+            finally:
+                xl_toggle.observe(wm.on_xl_toggle, names='value')
 
         show_notification("Settings imported successfully!", "success")
     except Exception as e:
@@ -375,22 +421,27 @@ def apply_imported_settings(data):
 # --- NOTIFICATION SYSTEM ---
 notification_popup = factory.create_html('', class_names=['notification-popup', 'hidden'])
 
-def show_notification(message, message_type='info'):
-    """Show notification popup"""
-    icon_map = {
-        'success': '✅',
-        'error': '❌',
-        'info': 'ℹ️',
-        'warning': '⚠️'
-    }
-    icon = icon_map.get(message_type, 'ℹ️')
-
-    notification_popup.value = f'''
+_NOTIFICATION_ICONS = {
+    'success': '✅',
+    'error': '❌',
+    'info': 'ℹ️',
+    'warning': '⚠️'
+}
+# One pre-rendered template per type; only the escaped message is filled in per call
+_NOTIFICATION_TEMPLATES = {
+    message_type: f'''
     <div class="notification {message_type}">
         <span class="notification-icon">{icon}</span>
-        <span class="notification-text">{message}</span>
+        <span class="notification-text">{{message}}</span>
     </div>
     '''
+    for message_type, icon in _NOTIFICATION_ICONS.items()
+}
+
+def show_notification(message, message_type='info'):
+    """Show notification popup"""
+    template = _NOTIFICATION_TEMPLATES.get(message_type, _NOTIFICATION_TEMPLATES['info'])
+    notification_popup.value = template.format(message=html.escape(str(message)))
 
     notification_popup.remove_class('visible')
     notification_popup.remove_class('hidden')
@@ -405,27 +456,29 @@ if IN_COLAB:
     output.register_callback('showNotificationFromJS', show_notification)
 
 # --- LOAD CSS/JS ---
-try:
-    factory.load_css(widgets_css)
-    print("✅ CSS loaded successfully")
-except Exception as e:
-    print(f"⚠️ Warning: Could not load CSS: {e}")
+# The JS is only needed on Colab; the files are read in the background until main() injects them
+ASSET_PATHS = (widgets_css, widgets_js if IN_COLAB else None)
+_asset_preload = factory.preload_assets(*filter(None, ASSET_PATHS))
 
-if IN_COLAB:
+def load_widget_assets():
+    """Inject the preloaded CSS/JS with a single display call."""
     try:
-        factory.load_js(widgets_js)
-        print("✅ JavaScript loaded successfully")
+        _asset_preload.join()
+        factory.load_assets(*ASSET_PATHS)
+        print("✅ CSS/JS loaded successfully")
     except Exception as e:
-        print(f"⚠️ Warning: Could not load JavaScript: {e}")
+        print(f"⚠️ Warning: Could not load CSS/JS: {e}")
 
 # --- MAIN EXECUTION ---
 def main():
     """Main function to create and display the widget interface"""
     
-    print("🎯 LSDAI Widget Interface")
-    print("=" * 30)
+    print("🎯 LSDAI Widget Interface\n" + "=" * 30)
     
     try:
+        # Inject styles before any widget is built
+        load_widget_assets()
+        
         # Create widgets
         wm.create_widgets()
         